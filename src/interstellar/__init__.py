@@ -1,5 +1,6 @@
 """Package initialization with dynamic version and public API exports."""
 
+import importlib
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as get_version
 from pathlib import Path
@@ -12,7 +13,17 @@ try:
 except PackageNotFoundError:
     __version__ = "0.0.0"
 
+__all__ = ["BIP39", "SLIP39", "__version__", "PACKAGE_NAME"]
+
+
 # Re-export public API
-from interstellar.tools import BIP39, SLIP39  # noqa: E402
+def __getattr__(name: str) -> object:
+    """Re-export public API lazily so importing the CLI skips the crypto stack."""
+    if name == "tools":
+        return importlib.import_module(f"{__name__}.tools")
+    if name in ("BIP39", "SLIP39"):
+        from interstellar import tools
 
-__all__ = ["BIP39", "SLIP39", "__version__", "PACKAGE_NAME"]
+        globals()[name] = value = getattr(tools, name)
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
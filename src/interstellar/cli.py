@@ -1,26 +1,73 @@
 import json
 import logging
+from collections.abc import Iterator
+from functools import cached_property
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as get_version
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 
-from interstellar.tools import BIP39, SLIP39
+if TYPE_CHECKING:
+    from interstellar.tools import BIP39, SLIP39
 
 PACKAGE_NAME = Path(__file__).parent.name
 
 logging.getLogger("slip39").setLevel(logging.ERROR)
 
 
+def to_json(output: object) -> str:
+    """Serialize command output as compact JSON.
+
+    Args:
+        output: JSON-serializable command result.
+
+    Returns:
+        JSON string without insignificant whitespace.
+    """
+    return json.dumps(output, separators=(",", ":"), ensure_ascii=False)
+
+
 class CLI:
     """Command Line Interface for BIP39 mnemonic generation and validation."""
 
-    def __init__(self) -> None:
-        """Initialize CLI with BIP39 and SLIP39 handlers."""
-        self.bip39 = BIP39()
-        self.slip39 = SLIP39()
+    @cached_property
+    def bip39(self) -> "BIP39":
+        """BIP39 handler, created on first use so --help and version skip it."""
+        from interstellar.tools import BIP39
+
+        return BIP39()
+
+    @cached_property
+    def slip39(self) -> "SLIP39":
+        """SLIP39 handler, created on first use so --help and version skip it."""
+        from interstellar.tools import SLIP39
+
+        return SLIP39()
+
+    @cached_property
+    def bip39_digits(self) -> dict[str, str]:
+        """Map of BIP39 words to 1-indexed digit strings."""
+        return {word: str(idx) for word, idx in self.bip39.map.items()}
+
+    @cached_property
+    def slip39_digits(self) -> dict[str, str]:
+        """Map of SLIP39 words to 1-indexed digit strings."""
+        return {word: str(idx) for word, idx in self.slip39.map.items()}
+
+    def iter_mnemos(self, filename: str) -> Iterator[list[str]]:
+        """Stream mnemonics from a file one line at a time.
+
+        Args:
+            filename: Path to file containing mnemonics.
+
+        Yields:
+            Mnemonic parts for each line.
+        """
+        with open(filename) as f:
+            for line in f:
+                yield [subline.strip() for subline in line.split(",")]
 
     def get_mnemos(self, filename: str) -> list[list[str]]:
         """Read mnemonics from a file.
@@ -31,23 +78,36 @@ class CLI:
         Returns:
             2D list of mnemonic parts, one row per line.
         """
+        return list(self.iter_mnemos(filename))
+
+    def get_first_mnemo(self, filename: str) -> str:
+        """Read the first mnemonic from a file.
+
+        Args:
+            filename: Path to file containing mnemonics.
+
+        Returns:
+            The first comma-separated entry on the first line.
+        """
         with open(filename) as f:
-            return [
-                [subline.strip() for subline in line.strip().split(",")]
-                for line in f.readlines()
-            ]
+            return f.readline().split(",")[0].strip()
 
-    def enforce_standard(self, standard: str) -> None:
+    def enforce_standard(self, standard: str) -> str:
         """Validate that standard is either 'BIP39' or 'SLIP39'.
 
         Args:
             standard: The standard to validate.
 
+        Returns:
+            The standard normalized to upper case.
+
         Raises:
             ValueError: If standard is not 'BIP39' or 'SLIP39'.
         """
-        if standard.upper() not in ["SLIP39", "BIP39"]:
+        standard = standard.upper()
+        if standard not in ("SLIP39", "BIP39"):
             raise ValueError("Standard must be either 'SLIP39' or 'BIP39'")
+        return standard
 
     def parse_2D_list(self, value: str) -> list[list[str]]:
         """Parse a string representation of a 2D list.
@@ -56,14 +116,13 @@ class CLI:
             value: Semicolon-separated rows, comma-separated columns.
 
         Returns:
-            2D list of strings.
+            2D list of strings, skipping empty rows.
         """
-        value = value.strip()
-        if not value:
-            return []
-        lines = value.split(";")
-        result = [line.strip().split(",") for line in lines]
-        return result
+        return [
+            stripped.split(",")
+            for line in value.split(";")
+            if (stripped := line.strip())
+        ]
 
 
 app = typer.Typer(context_settings={"help_option_names": ["-h", "--help"]})
@@ -125,12 +184,10 @@ def deconstruct(
     ] = False,
 ) -> None:
     """Split a BIP39 mnemonic into parts or SLIP39 shares."""
-    cli.enforce_standard(standard)
+    standard = cli.enforce_standard(standard)
     if not mnemonic and filename:
         try:
-            mnemos = cli.get_mnemos(filename)
-            if mnemos and mnemos[0]:
-                mnemonic = mnemos[0][0]
+            mnemonic = cli.get_first_mnemo(filename)
         except FileNotFoundError:
             raise typer.BadParameter(f"File not found: {filename}") from None
     if not mnemonic:
@@ -141,14 +198,14 @@ def deconstruct(
     split = 2 if word_count == 24 else 1
 
     bip_parts = cli.bip39.deconstruct(mnemonic, split)
-    if standard.upper() == "BIP39":
+    if standard == "BIP39":
         output = []
         for bip_part in bip_parts:
             mnemonic_output = bip_part
             if digits:
                 # Convert words to 1-indexed digits
                 mnemonic_output = " ".join(
-                    str(cli.bip39.map[word]) for word in bip_part.split()
+                    map(cli.bip39_digits.__getitem__, bip_part.split())
                 )
             output.append(
                 {
@@ -158,17 +215,15 @@ def deconstruct(
                     "digits": digits,
                 }
             )
-        typer.echo(json.dumps(output))
+        typer.echo(to_json(output))
         raise typer.Exit(code=0)
     else:
         total_shares: list[list[str]] = []
         for part in bip_parts:
             shares = cli.slip39.deconstruct(part, required, total)
             if digits:
-                shares = [
-                    " ".join(str(cli.slip39.map[word]) for word in share.split())
-                    for share in shares
-                ]
+                to_digit = cli.slip39_digits.__getitem__
+                shares = [" ".join(map(to_digit, share.split())) for share in shares]
             total_shares.append(shares)
 
         output = {
@@ -177,7 +232,7 @@ def deconstruct(
             "split": split,
             "digits": digits,
         }
-        typer.echo(json.dumps(output))
+        typer.echo(to_json(output))
         raise typer.Exit(code=0)
 
 
@@ -211,7 +266,7 @@ def reconstruct(
     ] = False,
 ) -> None:
     """Reconstruct a BIP39 mnemonic from SLIP39 shares or BIP39 parts."""
-    cli.enforce_standard(standard)
+    standard = cli.enforce_standard(standard)
     if not shares and filename:
         try:
             shares = cli.get_mnemos(filename)
@@ -222,24 +277,28 @@ def reconstruct(
 
     required = 0
 
-    if standard.upper() == "SLIP39":
+    if standard == "SLIP39":
+        words = cli.slip39.words
+        get_required = cli.slip39.get_required
+        recover = cli.slip39.reconstruct
         groups = shares
         shares = []
         for gidx, group in enumerate(groups):
             if digits:
                 group = [
-                    " ".join(cli.slip39.words[int(idx) - 1] for idx in member.split())
+                    " ".join([words[int(idx) - 1] for idx in member.split()])
                     for member in group
                 ]
 
-            required = cli.slip39.get_required(group[gidx])
-            shares.append(cli.slip39.reconstruct(group))
+            required = get_required(group[gidx])
+            shares.append(recover(group))
     else:  # BIP39
         shares = [part for group in shares for part in group]
         if digits:
             # Convert 1-indexed digits back to words
+            words = cli.bip39.words
             shares = [
-                " ".join(cli.bip39.words[int(idx) - 1] for idx in share.split())
+                " ".join([words[int(idx) - 1] for idx in share.split()])
                 for share in shares
             ]
     reconstructed = cli.bip39.reconstruct(shares)
@@ -250,7 +309,7 @@ def reconstruct(
         "required": required,
         "digits": digits,
     }
-    typer.echo(json.dumps(output))
+    typer.echo(to_json(output))
     raise typer.Exit(code=0)
 
 
@@ -29,6 +29,7 @@ import importlib
 import subprocess
 import sys
 import tomllib
+from functools import cache
 from pathlib import Path
 
 
@@ -38,8 +39,9 @@ def run(cmd: list[str]) -> subprocess.CompletedProcess:
     return subprocess.run(cmd, capture_output=True, text=True, check=True)
 
 
+@cache
 def get_package_name() -> str:
-    """Get package name from pyproject.toml."""
+    """Get package name from pyproject.toml, searched for once per run."""
     # Assumes Python 3.11+ for tomllib
     current_path = Path(__file__).resolve().parent
     while current_path != current_path.parent:
@@ -93,6 +95,9 @@ def test_imports() -> None:
     # Test submodule imports
     tools_module = importlib.import_module(f"{package}.tools")
     assert hasattr(tools_module, "BIP39")
+    # Lazy re-exports must resolve to the tools classes
+    assert pkg.BIP39 is tools_module.BIP39
+    assert pkg.SLIP39 is tools_module.SLIP39
 
     cli_module = importlib.import_module(f"{package}.cli")
     assert hasattr(cli_module, "app")
@@ -1,5 +1,7 @@
 import json
 import os
+import subprocess
+import sys
 import tempfile
 
 from conftest import SPLIT_PARTS, WORDS_24, assert_eth_addr
@@ -32,6 +34,17 @@ class TestVersion:
         parsed = parse_version(version_str.removeprefix("v"))
         assert parsed.release, "Version must have at least one release segment"
 
+    def test_version_skips_tools(self):
+        """Test importing the CLI and running version does not load tools."""
+        code = (
+            "import sys\n"
+            "from typer.testing import CliRunner\n"
+            "from interstellar.cli import app\n"
+            "assert CliRunner().invoke(app, ['version']).exit_code == 0\n"
+            "assert 'interstellar.tools' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
 
 class TestDeconstruct:
     """Test the deconstruct CLI command."""
@@ -125,6 +138,25 @@ class TestDeconstruct:
         finally:
             os.unlink(temp_file)
 
+    def test_from_file_first_line(self):
+        """Test deconstruction from file only uses the first mnemonic."""
+        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
+            f.write(f" {self.mnemo_24} ,ignored\nignored\n")
+            temp_file = f.name
+
+        try:
+            result = runner.invoke(
+                app, ["deconstruct", "--filename", temp_file, "--standard", "BIP39"]
+            )
+
+            assert result.exit_code == 0
+            output = json.loads(result.stdout)
+            assert len(output) == SPLIT_PARTS
+            parts = [item["mnemonic"] for item in output]
+            assert self.bip39.reconstruct(parts) == self.mnemo_24
+        finally:
+            os.unlink(temp_file)
+
     def test_with_digits(self):
         """Test deconstruction with digits output."""
         result = runner.invoke(
@@ -206,6 +238,20 @@ class TestReconstruct:
         assert output["mnemonic"] == self.mnemo_24
         assert_eth_addr(output.get("eth_addr"))
 
+    def test_slip39_option_empty_rows(self):
+        """Test SLIP39 reconstruction ignores empty rows in --shares."""
+        bip_parts = self.bip39.deconstruct(self.mnemo_24, SPLIT_PARTS)
+        shares_group1 = self.slip39.deconstruct(bip_parts[0], required=2, total=3)
+        shares_group2 = self.slip39.deconstruct(bip_parts[1], required=2, total=3)
+
+        shares_str = f"{shares_group1[0]},{shares_group1[1]}; ;{shares_group2[0]},{shares_group2[1]};"
+
+        result = runner.invoke(app, ["reconstruct", "--shares", shares_str])
+
+        assert result.exit_code == 0
+        output = json.loads(result.stdout)
+        assert output["mnemonic"] == self.mnemo_24
+
     def test_bip39_file(self):
         """Test BIP39 reconstruction from file."""
         # Use CLI to get properly formatted BIP39 output